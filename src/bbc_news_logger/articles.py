@@ -3,15 +3,44 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import random
 from dataclasses import dataclass
 from datetime import datetime
 
 import aiohttp
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-from .config import DEFAULT_REQUESTS_PER_SECOND, DEFAULT_TIMEOUT_SECONDS, DEFAULT_USER_AGENT
+from .config import (
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_TIMEOUT_SECONDS,
+    DEFAULT_USER_AGENT,
+    RETRY_STATUSES,
+)
 from .models import ArticleSnapshot, normalize_url, utc_now
 
+ARTICLE_FETCH_MAX_ATTEMPTS = 4
+ARTICLE_RETRY_BASE_SECONDS = 0.5
+ARTICLE_RETRY_MAX_SECONDS = 10.0
+
+# Lexbor compares attribute values case-sensitively unless a selector carries the ``i`` flag.
+CANONICAL_SELECTOR = 'link[rel="canonical" i]'
+OG_TITLE_SELECTOR = 'meta[property="og:title" i]'
+HEADING_SELECTOR = "h1"
+AUTHOR_SELECTOR = '[rel="author" i], [itemprop="name" i]'
+BYLINE_SELECTOR = 'meta[name="byl" i]'
+TEXT_BLOCK_SELECTOR = '[data-component="text-block" i]'
+ARTICLE_SELECTOR = ", ".join(
+    (
+        CANONICAL_SELECTOR,
+        OG_TITLE_SELECTOR,
+        HEADING_SELECTOR,
+        AUTHOR_SELECTOR,
+        BYLINE_SELECTOR,
+        TEXT_BLOCK_SELECTOR,
+    )
+)
+
 
 @dataclass(frozen=True)
 class ArticleTarget:
@@ -39,26 +68,47 @@ class AsyncRateLimiter:
             self._last_start = loop.time()
 
 
+def _attribute(node: LexborNode, name: str) -> str:
+    return (node.attributes.get(name) or "").lower()
+
+
 def parse_article_html(html: str) -> tuple[str | None, str, list[str], str, str]:
-    tree = HTMLParser(html)
-    canonical_node = tree.css_first('link[rel="canonical"]')
+    tree = LexborHTMLParser(html)
+    canonical_node = og_title_node = heading = byline = None
+    author_nodes: list[LexborNode] = []
+    body_nodes: list[LexborNode] = []
+    seen: set[int] = set()
+    # One document-order walk; Lexbor yields a node once per selector it matches.
+    for node in tree.css(ARTICLE_SELECTOR):
+        if node.mem_id in seen:
+            continue
+        seen.add(node.mem_id)
+        tag, rel = node.tag, _attribute(node, "rel")
+        if tag == "link" and rel == "canonical":
+            canonical_node = canonical_node or node
+        elif tag == "meta":
+            if _attribute(node, "property") == "og:title":
+                og_title_node = og_title_node or node
+            elif _attribute(node, "name") == "byl":
+                byline = byline or node
+        elif tag == "h1":
+            heading = heading or node
+        if rel == "author" or _attribute(node, "itemprop") == "name":
+            author_nodes.append(node)
+        if _attribute(node, "data-component") == "text-block":
+            body_nodes.append(node)
+
     canonical = (
-        canonical_node.attributes.get("href", "").strip() if canonical_node else None
+        (canonical_node.attributes.get("href") or "").strip() if canonical_node else None
     ) or None
-    title_node = tree.css_first('meta[property="og:title"]')
-    title = title_node.attributes.get("content", "").strip() if title_node else ""
-    if not title and (heading := tree.css_first("h1")):
+    title = (og_title_node.attributes.get("content") or "").strip() if og_title_node else ""
+    if not title and heading:
         title = heading.text(strip=True)
 
-    authors = {
-        node.text(strip=True)
-        for node in tree.css('[rel="author"], [itemprop="name"]')
-        if node.text(strip=True)
-    }
-    if (byline := tree.css_first('meta[name="byl"]')) and byline.attributes.get("content"):
+    authors = {text for node in author_nodes if (text := node.text(strip=True))}
+    if byline and byline.attributes.get("content"):
         authors.add(byline.attributes["content"].strip())
 
-    body_nodes = tree.css('[data-component="text-block"]')
     if body_nodes:
         article_html = "".join(node.html for node in body_nodes)
         article_text = " ".join(node.text(separator=" ", strip=True) for node in body_nodes)
@@ -71,45 +121,106 @@ def parse_article_html(html: str) -> tuple[str | None, str, list[str], str, str]
     return canonical, title, sorted(authors), article_html, article_text
 
 
+class RetryableFetchError(Exception):
+    """Raised for a transient article response that should be retried after a backoff."""
+
+    def __init__(self, status: int, retry_after: float | None = None) -> None:
+        super().__init__(f"HTTP {status}")
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a delta-seconds Retry-After; HTTP dates and junk fall back to plain backoff."""
+
+    try:
+        requested = float(value) if value else None
+    except ValueError:
+        return None
+    if requested is None or math.isnan(requested):
+        return None
+    return max(requested, 0.0)
+
+
+def _retry_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Full-jitter exponential backoff that never undercuts a server's Retry-After."""
+
+    ceiling = min(ARTICLE_RETRY_MAX_SECONDS, ARTICLE_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+    return max(random.uniform(0, ceiling), retry_after or 0.0)
+
+
+def _failed_snapshot(target: ArticleTarget, fetched_at: datetime) -> ArticleSnapshot:
+    return ArticleSnapshot.create(
+        requested_url=target.url,
+        canonical_url=normalize_url(target.url),
+        first_observed_at=target.first_observed_at,
+        fetched_at=fetched_at,
+        title="",
+        authors=[],
+        article_text="",
+        article_html="",
+        http_status=None,
+        fetch_ok=False,
+    )
+
+
 async def fetch_one(
     session: aiohttp.ClientSession,
     target: ArticleTarget,
     limiter: AsyncRateLimiter,
 ) -> ArticleSnapshot:
-    await limiter.wait()
-    fetched_at = utc_now()
-    try:
-        async with session.get(
-            target.url,
-            headers={"User-Agent": DEFAULT_USER_AGENT},
-            allow_redirects=True,
-        ) as response:
-            html = await response.text(errors="replace")
-            canonical, title, authors, article_html, article_text = parse_article_html(html)
-            return ArticleSnapshot.create(
-                requested_url=target.url,
-                canonical_url=canonical or str(response.url),
-                first_observed_at=target.first_observed_at,
-                fetched_at=fetched_at,
-                title=title,
-                authors=authors,
-                article_text=article_text,
-                article_html=article_html,
-                http_status=response.status,
-                fetch_ok=response.status == 200,
+    for attempt in range(1, ARTICLE_FETCH_MAX_ATTEMPTS + 1):
+        final = attempt == ARTICLE_FETCH_MAX_ATTEMPTS
+        await limiter.wait()
+        fetched_at = utc_now()
+        try:
+            return await _fetch_snapshot(
+                session,
+                target,
+                fetched_at,
+                retry_statuses=() if final else RETRY_STATUSES,
             )
-    except Exception:
+        except RetryableFetchError as exc:
+            retry_after = exc.retry_after
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if final:
+                return _failed_snapshot(target, fetched_at)
+            retry_after = None
+        except Exception:
+            return _failed_snapshot(target, fetched_at)
+        await asyncio.sleep(_retry_delay(attempt, retry_after))
+    raise AssertionError("unreachable: the final attempt always returns")
+
+
+async def _fetch_snapshot(
+    session: aiohttp.ClientSession,
+    target: ArticleTarget,
+    fetched_at: datetime,
+    *,
+    retry_statuses: tuple[int, ...],
+) -> ArticleSnapshot:
+    async with session.get(
+        target.url,
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+        allow_redirects=True,
+    ) as response:
+        if response.status in retry_statuses:
+            retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+            # A server asking for more than the retry budget gets no retry; keep its response.
+            if retry_after is None or retry_after <= ARTICLE_RETRY_MAX_SECONDS:
+                raise RetryableFetchError(response.status, retry_after)
+        html = await response.text(errors="replace")
+        canonical, title, authors, article_html, article_text = parse_article_html(html)
         return ArticleSnapshot.create(
             requested_url=target.url,
-            canonical_url=normalize_url(target.url),
+            canonical_url=canonical or str(response.url),
             first_observed_at=target.first_observed_at,
             fetched_at=fetched_at,
-            title="",
-            authors=[],
-            article_text="",
-            article_html="",
-            http_status=None,
-            fetch_ok=False,
+            title=title,
+            authors=authors,
+            article_text=article_text,
+            article_html=article_html,
+            http_status=response.status,
+            fetch_ok=response.status == 200,
         )
 
 
@@ -119,13 +230,30 @@ async def fetch_articles(
     requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
     concurrency: int = 8,
 ) -> list[ArticleSnapshot]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
     deduplicated: dict[str, ArticleTarget] = {}
-    for target in sorted(targets, key=lambda item: item.first_observed_at):
-        deduplicated.setdefault(normalize_url(target.url), target)
+    for target in targets:
+        key = normalize_url(target.url)
+        current = deduplicated.get(key)
+        if current is None or target.first_observed_at < current.first_observed_at:
+            deduplicated[key] = target
     limiter = AsyncRateLimiter(requests_per_second)
+    results: dict[int, ArticleSnapshot] = {}
+    # Workers share one iterator, so only `concurrency` fetches exist at any moment.
+    pending = enumerate(deduplicated.values())
+
+    async def worker(session: aiohttp.ClientSession) -> None:
+        for index, target in pending:
+            results[index] = await fetch_one(session, target, limiter)
+
     timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_SECONDS)
-    connector = aiohttp.TCPConnector(limit=concurrency)
+    connector = aiohttp.TCPConnector(
+        limit=concurrency,
+        limit_per_host=concurrency,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
     async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-        return await asyncio.gather(
-            *(fetch_one(session, target, limiter) for target in deduplicated.values())
-        )
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+    return [results[index] for index in range(len(deduplicated))]
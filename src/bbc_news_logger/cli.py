@@ -11,6 +11,7 @@ import tempfile
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
+import pyarrow as pa
 from huggingface_hub import HfApi
 
 from .articles import ArticleTarget, fetch_articles
@@ -52,6 +53,20 @@ def command_scrape(args: argparse.Namespace) -> None:
     )
 
 
+def first_seen_targets(observations: pa.Table) -> list[ArticleTarget]:
+    """One article target per URL, stamped with its earliest observation."""
+
+    first_seen = observations.group_by("url", use_threads=False).aggregate([("observed_at", "min")])
+    return [
+        ArticleTarget(url=url, first_observed_at=coerce_utc(seen))
+        for url, seen in zip(
+            first_seen.column("url").to_pylist(),
+            first_seen.column("observed_at_min").to_pylist(),
+            strict=True,
+        )
+    ]
+
+
 def command_fetch_articles(args: argparse.Namespace) -> None:
     day = (
         date.fromisoformat(args.date)
@@ -59,14 +74,14 @@ def command_fetch_articles(args: argparse.Namespace) -> None:
         else datetime.now(timezone.utc).date() - timedelta(days=1)
     )
     publisher = HuggingFacePublisher(dataset_id=args.dataset, raw_dataset_id=args.raw_dataset)
-    table = publisher.read_table(args.dataset, partition_path("observations", day))
+    table = publisher.read_table(
+        args.dataset,
+        partition_path("observations", day),
+        columns=["url", "observed_at"],
+    )
     if table is None or table.num_rows == 0:
         raise SystemExit(f"No observations found for {day:%Y-%m-%d}")
-    first_seen: dict[str, datetime] = {}
-    for row in sorted(table.to_pylist(), key=lambda value: value["observed_at"]):
-        first_seen.setdefault(row["url"], coerce_utc(row["observed_at"]))
-    targets = [ArticleTarget(url=url, first_observed_at=seen) for url, seen in first_seen.items()]
-    snapshots = asyncio.run(fetch_articles(targets))
+    snapshots = asyncio.run(fetch_articles(first_seen_targets(table)))
     if args.upload:
         publisher.publish_articles(snapshots, day)
     print(
@@ -13,6 +13,7 @@ import pyarrow.parquet as pq
 from huggingface_hub import CommitOperationAdd, CommitOperationDelete, HfApi, snapshot_download
 
 from .config import DEFAULT_DATASET_ID
+from .storage import write_parquet
 
 COMPACTABLE_PREFIXES = (
     "data/observations",
@@ -94,7 +95,7 @@ def compact_remote_dataset(
         files = parquet_files(snapshot, prefix)
         table = compact_table(prefix, files)
         local = output / Path(compact_path(prefix)).name
-        pq.write_table(table, local, compression="zstd")
+        write_parquet(table, local)
         local_files[prefix] = local
         report[prefix] = {
             "source_files": len(files),
@@ -15,5 +15,6 @@ DEFAULT_USER_AGENT = os.getenv(
 )
 DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_REQUESTS_PER_SECOND = 5.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 SCHEMA_VERSION = 1
 LOCAL_DATA_DIR = Path(os.getenv("BBC_NEWS_LOCAL_DATA", "site-data"))
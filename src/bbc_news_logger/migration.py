@@ -140,8 +140,10 @@ def read_legacy_articles(
 def build_migration(data_dir: Path, output_dir: Path, source_commit: str) -> dict[str, object]:
     observations, observation_sources = read_legacy_observations(data_dir)
     first_observed_by_url: dict[str, datetime] = {}
-    for row in sorted(observations, key=lambda item: item.observed_at):
-        first_observed_by_url.setdefault(row.url, row.observed_at)
+    for row in observations:
+        seen = first_observed_by_url.get(row.url)
+        if seen is None or row.observed_at < seen:
+            first_observed_by_url[row.url] = row.observed_at
     articles, article_sources = read_legacy_articles(data_dir, first_observed_by_url)
     destinations: list[dict[str, object]] = []
 
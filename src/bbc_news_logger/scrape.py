@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import os
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util.retry import Retry
 
-from .config import BBC_NEWS_URL, DEFAULT_TIMEOUT_SECONDS, DEFAULT_USER_AGENT
-from .models import Observation, ScrapeResult, ScrapeRun, stable_id, utc_now
+from .config import BBC_NEWS_URL, DEFAULT_TIMEOUT_SECONDS, DEFAULT_USER_AGENT, RETRY_STATUSES
+from .models import Observation, ScrapeResult, ScrapeRun, normalize_url, stable_id, utc_now
 
 MOST_READ_SELECTORS = (
     'div[data-component="mostRead"] ol',
@@ -27,75 +31,128 @@ PROMO_GRID_SELECTORS = (
     '[data-entityid="container-top-stories#1"] ul',
     'section[data-component="top-stories"] ul',
 )
+PROMO_LINK_SELECTOR = 'a[class*="-PromoLink"]'
+PROMO_HEADLINE_SELECTOR = '[class*="-PromoHeadline"]'
 
 
 class ScrapeValidationError(RuntimeError):
     """Raised when the BBC response no longer satisfies the collection contract."""
 
 
-def _select_first(soup: BeautifulSoup, selectors: tuple[str, ...]):
+@dataclass(frozen=True, slots=True)
+class HomepageLink:
+    position: int
+    title: str
+    url: str
+
+
+def build_session() -> requests.Session:
+    """Return a keep-alive session that retries transient BBC failures with backoff."""
+
+    session = requests.Session()
+    session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+        # A long server Retry-After would outlast the scheduled job's timeout.
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+
+def _select_first(tree: LexborHTMLParser, selectors: tuple[str, ...]) -> LexborNode | None:
     for selector in selectors:
-        if node := soup.select_one(selector):
+        if node := tree.css_first(selector):
             return node
     return None
 
 
-def scrape_most_read(soup: BeautifulSoup, limit: int = 10) -> list[dict[str, object]]:
-    container = _select_first(soup, MOST_READ_SELECTORS)
+def _descendant_first(node: LexborNode, selector: str) -> LexborNode | None:
+    """Like ``css_first`` but never the node itself, which Lexbor also tests against."""
+
+    for match in node.css(selector):
+        if match.mem_id != node.mem_id:
+            return match
+    return None
+
+
+def _node_text(node: LexborNode) -> str:
+    """Collapse whitespace so formatting between child elements never reaches a title."""
+
+    return " ".join(node.text(separator=" ").split())
+
+
+def scrape_most_read(tree: LexborHTMLParser, limit: int = 10) -> list[HomepageLink]:
+    container = _select_first(tree, MOST_READ_SELECTORS)
     if container is None:
         return []
-    stories: list[dict[str, object]] = []
-    for position, item in enumerate(container.find_all("li", limit=limit), start=1):
-        link = item.find("a")
-        if not link or not link.get("href"):
+    stories: list[HomepageLink] = []
+    for position, item in enumerate(container.css("li")[:limit], start=1):
+        link = item.css_first("a")
+        href = link.attributes.get("href") if link else None
+        if not href:
             continue
-        title = link.get_text(" ", strip=True)
+        title = _node_text(link)
         if title:
-            stories.append({"position": position, "title": title, "url": link["href"]})
+            stories.append(HomepageLink(position, title, href))
     return stories
 
 
-def scrape_front_page_promos(soup: BeautifulSoup, limit: int = 10) -> list[dict[str, object]]:
-    container = _select_first(soup, PROMO_GRID_SELECTORS)
-    links = container.find_all("a") if container else soup.select('a[class*="-PromoLink"]')
-    stories: list[dict[str, object]] = []
+def scrape_front_page_promos(tree: LexborHTMLParser, limit: int = 10) -> list[HomepageLink]:
+    container = _select_first(tree, PROMO_GRID_SELECTORS)
+    links = container.css("a") if container else tree.css(PROMO_LINK_SELECTOR)
+    stories: list[HomepageLink] = []
     seen_urls: set[str] = set()
     for link in links:
-        href = link.get("href")
-        if not href or href in seen_urls:
+        href = link.attributes.get("href")
+        url = normalize_url(href) if href else ""
+        if not url or url in seen_urls:
             continue
-        headline = link.select_one('[class*="-PromoHeadline"]')
+        headline = _descendant_first(link, PROMO_HEADLINE_SELECTOR)
         if headline is None and link.parent is not None:
-            headline = link.parent.select_one('[class*="-PromoHeadline"]')
-        title = (headline or link).get_text(" ", strip=True)
+            headline = _descendant_first(link.parent, PROMO_HEADLINE_SELECTOR)
+        title = _node_text(headline or link)
         if not title:
             continue
-        seen_urls.add(href)
-        stories.append({"position": len(stories) + 1, "title": title, "url": href})
+        seen_urls.add(url)
+        stories.append(HomepageLink(len(stories) + 1, title, url))
         if len(stories) >= limit:
             break
     return stories
 
 
-def parse_homepage(html: str, observed_at: datetime | None = None) -> tuple[Observation, ...]:
+def parse_homepage(
+    html: str,
+    observed_at: datetime | None = None,
+    *,
+    scrape_id: str | None = None,
+) -> tuple[Observation, ...]:
     observed_at = (observed_at or utc_now()).astimezone(timezone.utc)
-    soup = BeautifulSoup(html, "html.parser")
+    tree = LexborHTMLParser(html)
     groups = {
-        "most_read": scrape_most_read(soup),
-        "front_page": scrape_front_page_promos(soup),
+        "most_read": scrape_most_read(tree),
+        "front_page": scrape_front_page_promos(tree),
     }
     missing = [name for name, rows in groups.items() if not rows]
     if missing:
         raise ScrapeValidationError(f"No observations found for: {', '.join(missing)}")
 
-    scrape_id = stable_id(observed_at.isoformat(), "bbc-news-home")
+    scrape_id = scrape_id or stable_id(observed_at.isoformat(), "bbc-news-home")
     observations = tuple(
         Observation.create(
             observed_at=observed_at,
             surface=surface,
-            position=int(row["position"]),
-            title=str(row["title"]),
-            url=str(row["url"]),
+            position=row.position,
+            title=row.title,
+            url=row.url,
             scrape_id=scrape_id,
         )
         for surface, rows in groups.items()
@@ -113,7 +170,7 @@ def collect_homepage(
     started_at = utc_now()
     observed_at = (observed_at or started_at).astimezone(timezone.utc)
     scrape_id = stable_id(observed_at.isoformat(), "bbc-news-home")
-    client = session or requests.Session()
+    client = session or SESSION
     status: int | None = None
     try:
         response = client.get(
@@ -123,11 +180,8 @@ def collect_homepage(
         )
         status = response.status_code
         response.raise_for_status()
-        observations = parse_homepage(response.text, observed_at)
-        counts = {
-            surface: sum(item.surface == surface for item in observations)
-            for surface in ("most_read", "front_page")
-        }
+        observations = parse_homepage(response.text, observed_at, scrape_id=scrape_id)
+        counts = Counter(item.surface for item in observations)
         run = ScrapeRun(
             scrape_id=scrape_id,
             started_at=started_at,
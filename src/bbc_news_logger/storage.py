@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import json
 import os
-import tempfile
 from collections.abc import Iterable
-from dataclasses import asdict
 from datetime import date, datetime, timezone
 from pathlib import Path
 
@@ -18,6 +16,13 @@ from huggingface_hub.errors import EntryNotFoundError
 from .config import DEFAULT_DATASET_ID, DEFAULT_RAW_DATASET_ID, SCHEMA_VERSION
 from .models import ArticleSnapshot, Observation, ScrapeRun
 
+PARQUET_WRITE_OPTIONS: dict[str, object] = {
+    "compression": "zstd",
+    "compression_level": 9,
+    "use_dictionary": True,
+    "write_statistics": True,
+}
+
 OBSERVATION_SCHEMA = pa.schema(
     [
         pa.field("observed_at", pa.timestamp("us", tz="UTC"), nullable=False),
@@ -79,36 +84,30 @@ RAW_ARTICLE_SCHEMA = pa.schema(
 )
 
 
+def _columnar(rows: Iterable[object], schema: pa.Schema) -> pa.Table:
+    """Build a table in one batched call from dataclass attributes named by the schema."""
+
+    rows = tuple(rows)
+    return pa.Table.from_pydict(
+        {name: [getattr(row, name) for row in rows] for name in schema.names},
+        schema=schema,
+    )
+
+
 def observations_table(rows: Iterable[Observation]) -> pa.Table:
-    return pa.Table.from_pylist([asdict(row) for row in rows], schema=OBSERVATION_SCHEMA)
+    return _columnar(rows, OBSERVATION_SCHEMA)
 
 
 def scrape_runs_table(rows: Iterable[ScrapeRun]) -> pa.Table:
-    return pa.Table.from_pylist([asdict(row) for row in rows], schema=SCRAPE_RUN_SCHEMA)
+    return _columnar(rows, SCRAPE_RUN_SCHEMA)
 
 
 def articles_table(rows: Iterable[ArticleSnapshot]) -> pa.Table:
-    records = []
-    for row in rows:
-        value = asdict(row)
-        value.pop("article_html")
-        value["authors"] = list(row.authors)
-        records.append(value)
-    return pa.Table.from_pylist(records, schema=ARTICLE_SCHEMA)
+    return _columnar(rows, ARTICLE_SCHEMA)
 
 
 def raw_articles_table(rows: Iterable[ArticleSnapshot]) -> pa.Table:
-    records = [
-        {
-            "snapshot_id": row.snapshot_id,
-            "canonical_url": row.canonical_url,
-            "fetched_at": row.fetched_at,
-            "article_html": row.article_html,
-            "html_sha256": row.html_sha256,
-        }
-        for row in rows
-    ]
-    return pa.Table.from_pylist(records, schema=RAW_ARTICLE_SCHEMA)
+    return _columnar(rows, RAW_ARTICLE_SCHEMA)
 
 
 def partition_path(kind: str, day: date) -> str:
@@ -117,26 +116,33 @@ def partition_path(kind: str, day: date) -> str:
 
 def write_parquet(table: pa.Table, path: Path) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    pq.write_table(
-        table,
-        path,
-        compression="zstd",
-        compression_level=9,
-        use_dictionary=True,
-        write_statistics=True,
-    )
+    pq.write_table(table, path, **PARQUET_WRITE_OPTIONS)
     return path
 
 
+def parquet_bytes(table: pa.Table) -> bytes:
+    """Serialise a table in memory so it can be uploaded without a temporary file."""
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, **PARQUET_WRITE_OPTIONS)
+    return sink.getvalue().to_pybytes()
+
+
 def merge_unique(existing: pa.Table | None, incoming: pa.Table, keys: tuple[str, ...]) -> pa.Table:
-    rows: dict[tuple[object, ...], dict[str, object]] = {}
+    """Keep the last row per key, reading only key columns to choose which rows survive."""
+
+    tables = [incoming]
     if existing is not None:
-        for row in existing.to_pylist():
-            rows[tuple(row[key] for key in keys)] = row
-    for row in incoming.to_pylist():
-        rows[tuple(row[key] for key in keys)] = row
-    ordered = sorted(rows.values(), key=lambda row: tuple(str(row[key]) for key in keys))
-    return pa.Table.from_pylist(ordered, schema=incoming.schema)
+        if existing.schema.equals(incoming.schema):
+            existing = existing.replace_schema_metadata(incoming.schema.metadata)
+        else:
+            existing = pa.Table.from_pylist(existing.to_pylist(), schema=incoming.schema)
+        tables.insert(0, existing)
+    combined = pa.concat_tables(tables)
+    key_columns = [combined.column(key).to_pylist() for key in keys]
+    latest = {row_key: index for index, row_key in enumerate(zip(*key_columns, strict=True))}
+    ordered = sorted(latest.items(), key=lambda item: tuple(str(part) for part in item[0]))
+    return combined.take([index for _, index in ordered])
 
 
 class HuggingFacePublisher:
@@ -154,7 +160,12 @@ class HuggingFacePublisher:
         self.token = token or os.getenv("HF_TOKEN")
         self.api = HfApi(token=self.token)
 
-    def read_table(self, repo_id: str, path: str) -> pa.Table | None:
+    def read_table(
+        self,
+        repo_id: str,
+        path: str,
+        columns: list[str] | None = None,
+    ) -> pa.Table | None:
         try:
             local = hf_hub_download(
                 repo_id=repo_id,
@@ -164,7 +175,7 @@ class HuggingFacePublisher:
             )
         except EntryNotFoundError:
             return None
-        return pq.read_table(local)
+        return pq.read_table(local, columns=columns)
 
     def upsert_table(
         self,
@@ -177,15 +188,13 @@ class HuggingFacePublisher:
     ) -> int:
         existing = self.read_table(repo_id, path)
         merged = merge_unique(existing, incoming, keys)
-        with tempfile.TemporaryDirectory(prefix="bbc-news-publish-") as tmp:
-            local = write_parquet(merged, Path(tmp) / Path(path).name)
-            self.api.upload_file(
-                path_or_fileobj=local,
-                path_in_repo=path,
-                repo_id=repo_id,
-                repo_type="dataset",
-                commit_message=message,
-            )
+        self.api.upload_file(
+            path_or_fileobj=parquet_bytes(merged),
+            path_in_repo=path,
+            repo_id=repo_id,
+            repo_type="dataset",
+            commit_message=message,
+        )
         return merged.num_rows
 
     def publish_observations(self, rows: Iterable[Observation], run: ScrapeRun) -> None:
@@ -1,11 +1,17 @@
+import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
 
+import aiohttp
 import pytest
 
 from bbc_news_logger.articles import (
+    ARTICLE_FETCH_MAX_ATTEMPTS,
+    ARTICLE_RETRY_MAX_SECONDS,
     ArticleTarget,
     AsyncRateLimiter,
+    _retry_after_seconds,
+    _retry_delay,
     fetch_articles,
     parse_article_html,
 )
@@ -22,11 +28,47 @@ def test_parse_article_html() -> None:
     assert article_html
 
 
+def test_parse_article_html_falls_back_to_heading_and_main() -> None:
+    html = """
+    <html><head><meta property="og:title" content=""></head><body>
+      <main><h1>Heading</h1><span rel="author" itemprop="name">Writer</span><p>Body</p></main>
+    </body></html>
+    """
+    canonical, title, authors, article_html, article_text = parse_article_html(html)
+
+    assert canonical is None
+    assert title == "Heading"
+    assert authors == ["Writer"]
+    assert article_html.startswith("<main>")
+    assert article_text == "Heading Writer Body"
+
+
+def test_parse_article_html_matches_attribute_values_case_insensitively() -> None:
+    html = """
+    <html><head>
+      <link rel="Canonical" href="http://example.com/one">
+      <meta property="OG:TITLE" content="Title">
+      <meta name="BYL" content="Byline Writer">
+    </head><body>
+      <span rel="AUTHOR">Writer</span>
+      <div data-component="Text-Block"><p>Body</p></div>
+    </body></html>
+    """
+    canonical, title, authors, article_html, article_text = parse_article_html(html)
+
+    assert canonical == "http://example.com/one"
+    assert title == "Title"
+    assert authors == ["Byline Writer", "Writer"]
+    assert article_html.startswith('<div data-component="Text-Block">')
+    assert article_text == "Body"
+
+
 class MockResponse:
-    def __init__(self, url: str, body: str) -> None:
+    def __init__(self, url: str, body: str, status: int = 200) -> None:
         self.url = url
         self._body = body
-        self.status = 200
+        self.status = status
+        self.headers: dict[str, str] = {}
 
     async def text(self, **_: object) -> str:
         return self._body
@@ -68,3 +110,222 @@ async def test_fetch_articles_deduplicates_and_returns_snapshots(monkeypatch) ->
     assert all(snapshot.article_text for snapshot in snapshots)
     one = next(item for item in snapshots if item.requested_url.endswith("/one"))
     assert one.first_observed_at == first
+
+
+class DelayedResponse(MockResponse):
+    def __init__(self, url: str, body: str, delay: float, log: dict[str, list]) -> None:
+        super().__init__(url, body)
+        self._delay = delay
+        self._log = log
+
+    async def __aenter__(self) -> "DelayedResponse":
+        self._log["active"].append(self.url)
+        self._log["peak"].append(len(self._log["active"]))
+        await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self._log["active"].remove(self.url)
+        self._log["completed"].append(self.url)
+
+
+@pytest.mark.asyncio
+async def test_fetch_articles_caps_in_flight_requests(monkeypatch) -> None:
+    body = Path("tests/fixtures/art1.html").read_text()
+    log: dict[str, list] = {"active": [], "peak": [], "completed": []}
+
+    def fake_get(_self, url: str, **_kwargs: object) -> DelayedResponse:
+        return DelayedResponse(url, body, 0, log)
+
+    async def no_wait(_self) -> None:
+        return None
+
+    monkeypatch.setattr("aiohttp.ClientSession.get", fake_get, raising=False)
+    monkeypatch.setattr(AsyncRateLimiter, "wait", no_wait)
+    observed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    targets = [ArticleTarget(f"http://example.com/{index}", observed_at) for index in range(10)]
+
+    snapshots = await fetch_articles(targets, concurrency=3)
+
+    assert len(snapshots) == 10
+    assert max(log["peak"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_articles_returns_results_in_target_order(monkeypatch) -> None:
+    body = Path("tests/fixtures/art1.html").read_text()
+    log: dict[str, list] = {"active": [], "peak": [], "completed": []}
+    delays = {"http://example.com/a": 0.03, "http://example.com/b": 0.02, "http://example.com/c": 0}
+
+    def fake_get(_self, url: str, **_kwargs: object) -> DelayedResponse:
+        return DelayedResponse(url, body, delays[url], log)
+
+    async def no_wait(_self) -> None:
+        return None
+
+    monkeypatch.setattr("aiohttp.ClientSession.get", fake_get, raising=False)
+    monkeypatch.setattr(AsyncRateLimiter, "wait", no_wait)
+    observed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    targets = [ArticleTarget(url, observed_at) for url in delays]
+
+    snapshots = await fetch_articles(targets, concurrency=3)
+
+    assert log["completed"] == list(reversed(delays))
+    assert [snapshot.requested_url for snapshot in snapshots] == list(delays)
+
+
+@pytest.mark.asyncio
+async def test_fetch_articles_rejects_non_positive_concurrency() -> None:
+    target = ArticleTarget("http://example.com/one", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    with pytest.raises(ValueError, match="concurrency"):
+        await fetch_articles([target], concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_articles_retries_transient_statuses(monkeypatch) -> None:
+    body = Path("tests/fixtures/art1.html").read_text()
+    statuses = [503, 429, 200]
+
+    def fake_get(_self, url: str, **_kwargs: object) -> MockResponse:
+        return MockResponse(url, body, statuses.pop(0))
+
+    async def no_wait(_self) -> None:
+        return None
+
+    monkeypatch.setattr("aiohttp.ClientSession.get", fake_get, raising=False)
+    monkeypatch.setattr(AsyncRateLimiter, "wait", no_wait)
+    monkeypatch.setattr("bbc_news_logger.articles.ARTICLE_RETRY_BASE_SECONDS", 0)
+    target = ArticleTarget("http://example.com/one", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    (snapshot,) = await fetch_articles([target])
+
+    assert not statuses
+    assert snapshot.fetch_ok
+    assert snapshot.http_status == 200
+
+
+@pytest.mark.asyncio
+async def test_fetch_articles_records_final_retryable_status(monkeypatch) -> None:
+    body = Path("tests/fixtures/art1.html").read_text()
+    statuses = [503] * ARTICLE_FETCH_MAX_ATTEMPTS
+
+    def fake_get(_self, url: str, **_kwargs: object) -> MockResponse:
+        return MockResponse(url, body, statuses.pop(0))
+
+    async def no_wait(_self) -> None:
+        return None
+
+    monkeypatch.setattr("aiohttp.ClientSession.get", fake_get, raising=False)
+    monkeypatch.setattr(AsyncRateLimiter, "wait", no_wait)
+    monkeypatch.setattr("bbc_news_logger.articles.ARTICLE_RETRY_BASE_SECONDS", 0)
+    target = ArticleTarget("http://example.com/one", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    (snapshot,) = await fetch_articles([target])
+
+    assert not statuses
+    assert snapshot.http_status == 503
+    assert snapshot.fetch_ok is False
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("2", 2.0), ("3600", 3600.0), ("-1", 0.0), ("nan", None), ("soon", None), (None, None)],
+)
+def test_retry_after_seconds(value: str | None, expected: float | None) -> None:
+    assert _retry_after_seconds(value) == expected
+
+
+def test_retry_delay_honours_short_retry_after(monkeypatch) -> None:
+    monkeypatch.setattr("bbc_news_logger.articles.ARTICLE_RETRY_BASE_SECONDS", 0)
+
+    assert _retry_delay(1, 2.0) == 2.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_articles_waits_for_short_retry_after(monkeypatch) -> None:
+    body = Path("tests/fixtures/art1.html").read_text()
+    statuses = [429, 200]
+    sleeps: list[float] = []
+
+    def fake_get(_self, url: str, **_kwargs: object) -> MockResponse:
+        response = MockResponse(url, body, statuses.pop(0))
+        response.headers["Retry-After"] = str(ARTICLE_RETRY_MAX_SECONDS)
+        return response
+
+    async def no_wait(_self) -> None:
+        return None
+
+    def recording_delay(attempt: int, retry_after: float | None = None) -> float:
+        sleeps.append(_retry_delay(attempt, retry_after))
+        return 0
+
+    monkeypatch.setattr("aiohttp.ClientSession.get", fake_get, raising=False)
+    monkeypatch.setattr(AsyncRateLimiter, "wait", no_wait)
+    monkeypatch.setattr("bbc_news_logger.articles._retry_delay", recording_delay)
+    target = ArticleTarget("http://example.com/one", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    (snapshot,) = await fetch_articles([target])
+
+    assert not statuses
+    assert snapshot.fetch_ok
+    assert sleeps == [ARTICLE_RETRY_MAX_SECONDS]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("retry_after", ["3600", "inf"])
+async def test_fetch_articles_stops_on_long_retry_after(monkeypatch, retry_after: str) -> None:
+    body = Path("tests/fixtures/art1.html").read_text()
+    requested: list[str] = []
+    sleeps: list[float] = []
+
+    def fake_get(_self, url: str, **_kwargs: object) -> MockResponse:
+        requested.append(url)
+        response = MockResponse(url, body, 429)
+        response.headers["Retry-After"] = retry_after
+        return response
+
+    async def no_wait(_self) -> None:
+        return None
+
+    def recording_delay(attempt: int, retry_after: float | None = None) -> float:
+        sleeps.append(_retry_delay(attempt, retry_after))
+        return 0
+
+    monkeypatch.setattr("aiohttp.ClientSession.get", fake_get, raising=False)
+    monkeypatch.setattr(AsyncRateLimiter, "wait", no_wait)
+    monkeypatch.setattr("bbc_news_logger.articles._retry_delay", recording_delay)
+    target = ArticleTarget("http://example.com/one", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    (snapshot,) = await fetch_articles([target])
+
+    assert requested == ["http://example.com/one"]
+    assert not sleeps
+    assert snapshot.http_status == 429
+    assert snapshot.fetch_ok is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [aiohttp.ClientConnectionError("reset"), asyncio.TimeoutError()])
+async def test_fetch_articles_retries_connection_failures(monkeypatch, error: Exception) -> None:
+    body = Path("tests/fixtures/art1.html").read_text()
+    failures = [error]
+
+    def fake_get(_self, url: str, **_kwargs: object) -> MockResponse:
+        if failures:
+            raise failures.pop()
+        return MockResponse(url, body)
+
+    async def no_wait(_self) -> None:
+        return None
+
+    monkeypatch.setattr("aiohttp.ClientSession.get", fake_get, raising=False)
+    monkeypatch.setattr(AsyncRateLimiter, "wait", no_wait)
+    monkeypatch.setattr("bbc_news_logger.articles.ARTICLE_RETRY_BASE_SECONDS", 0)
+    target = ArticleTarget("http://example.com/one", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    (snapshot,) = await fetch_articles([target])
+
+    assert not failures
+    assert snapshot.fetch_ok
+    assert snapshot.http_status == 200
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from bbc_news_logger.cli import first_seen_targets
+
+
+def test_first_seen_targets_use_earliest_observation_per_url() -> None:
+    def at(hour: int) -> datetime:
+        return datetime(2026, 7, 13, hour, tzinfo=timezone.utc)
+
+    table = pa.table(
+        {
+            "url": ["https://a", "https://b", "https://a", "https://b", "https://a"],
+            "observed_at": [at(12), at(9), at(8), at(15), at(10)],
+        },
+        schema=pa.schema(
+            [
+                ("url", pa.string()),
+                ("observed_at", pa.timestamp("us", tz="UTC")),
+            ]
+        ),
+    )
+
+    targets = {target.url: target.first_observed_at for target in first_seen_targets(table)}
+
+    assert targets == {"https://a": at(8), "https://b": at(9)}
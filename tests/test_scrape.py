@@ -1,8 +1,17 @@
+import io
 from datetime import datetime, timezone
 
 import pytest
+import requests
+from urllib3 import HTTPResponse
 
-from bbc_news_logger.scrape import ScrapeValidationError, parse_homepage
+from bbc_news_logger.config import RETRY_STATUSES
+from bbc_news_logger.scrape import (
+    ScrapeValidationError,
+    build_session,
+    collect_homepage,
+    parse_homepage,
+)
 
 HOMEPAGE = """
 <html><body>
@@ -31,6 +40,89 @@ def test_parse_homepage_creates_stable_typed_observations() -> None:
     assert len({row.story_id for row in shared}) == 1
 
 
+def test_front_page_promos_deduplicate_equivalent_urls() -> None:
+    html = HOMEPAGE.replace(
+        '<li><a href="/news/articles/three">',
+        '<li><a href="https://www.bbc.co.uk/news/articles/two/?at_medium=x">'
+        "<span class='PromoHeadline'>Front two again</span></a></li>"
+        '<li><a href="/news/articles/three">',
+    )
+    rows = parse_homepage(html)
+
+    front = [row.url for row in rows if row.surface == "front_page"]
+    assert front == [
+        "https://www.bbc.co.uk/news/articles/two",
+        "https://www.bbc.co.uk/news/articles/three",
+    ]
+
+
+def test_titles_collapse_whitespace_between_child_elements() -> None:
+    html = HOMEPAGE.replace(
+        '<a href="/news/articles/one">Most read one</a>',
+        '<a href="/news/articles/one">\n  <span>Breaking</span>\n  <span>News here</span>\n</a>',
+    ).replace(
+        '<span class="PromoHeadline">Front two</span>',
+        '<span class="PromoHeadline">\n  <span>Front</span>  <b>two</b>\n</span>',
+    )
+    rows = parse_homepage(html)
+
+    titles = {(row.surface, row.position): row.title for row in rows}
+    assert titles[("most_read", 1)] == "Breaking News here"
+    assert titles[("front_page", 1)] == "Front two"
+
+
+def test_promo_headline_fallback_ignores_matching_parent() -> None:
+    html = HOMEPAGE.replace(
+        '<a href="/news/articles/three"><span class="PromoHeadline">Front three</span></a>',
+        '<div class="x-PromoHeadlineWrap"><a href="/news/articles/three">Image</a>'
+        '<span>LIVE</span><p class="y-PromoHeadline">Real headline</p></div>',
+    )
+    rows = parse_homepage(html)
+
+    titles = {row.url: row.title for row in rows if row.surface == "front_page"}
+    assert titles["https://www.bbc.co.uk/news/articles/three"] == "Real headline"
+
+
+class StaticAdapter(requests.adapters.HTTPAdapter):
+    def __init__(self, body: bytes, content_type: str) -> None:
+        super().__init__()
+        self.body = body
+        self.content_type = content_type
+
+    def send(self, request: requests.PreparedRequest, **_kwargs: object) -> requests.Response:
+        raw = HTTPResponse(
+            body=io.BytesIO(self.body),
+            headers={"Content-Type": self.content_type},
+            status=200,
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+@pytest.mark.parametrize(
+    ("charset", "expected"),
+    [("utf-8", "Most read \ufffd"), ("iso-8859-1", "Most read \xe9")],
+)
+def test_collect_homepage_decodes_declared_charset(charset: str, expected: str) -> None:
+    body = HOMEPAGE.replace("Most read one", "Most read \xe9").encode("latin-1")
+    session = requests.Session()
+    session.mount("https://", StaticAdapter(body, f"text/html; charset={charset}"))
+
+    result = collect_homepage(session=session)
+
+    titles = {row.title for row in result.observations if row.surface == "most_read"}
+    assert expected in titles
+
+
 def test_parse_homepage_rejects_missing_surface() -> None:
     with pytest.raises(ScrapeValidationError, match="most_read"):
         parse_homepage("<html><body><a class='x-PromoLink' href='/news/a'>A</a></body></html>")
+
+
+def test_build_session_retries_transient_statuses() -> None:
+    retries = build_session().get_adapter("https://www.bbc.co.uk/news").max_retries
+
+    assert retries.total == 3
+    assert set(retries.status_forcelist) == set(RETRY_STATUSES)
+    assert not retries.respect_retry_after_header
+    assert retries.raise_on_status is False
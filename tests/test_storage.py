@@ -1,5 +1,6 @@
 from datetime import date, datetime, timezone
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 from bbc_news_logger.models import ArticleSnapshot, Observation
@@ -7,6 +8,7 @@ from bbc_news_logger.storage import (
     articles_table,
     merge_unique,
     observations_table,
+    parquet_bytes,
     partition_path,
     raw_articles_table,
     write_parquet,
@@ -35,6 +37,38 @@ def test_observation_schema_and_merge_are_idempotent(tmp_path) -> None:
     )
 
 
+def test_parquet_bytes_matches_write_parquet(tmp_path) -> None:
+    row = Observation.create(
+        observed_at=NOW,
+        surface="most_read",
+        position=1,
+        title="Story",
+        url="https://www.bbc.co.uk/news/articles/example",
+    )
+    table = observations_table([row])
+    output = write_parquet(table, tmp_path / "part.parquet")
+
+    assert pq.read_table(pa.BufferReader(parquet_bytes(table))).equals(pq.read_table(output))
+
+
+def test_merge_unique_prefers_incoming_rows_per_key() -> None:
+    def observation(position: int, title: str) -> Observation:
+        return Observation.create(
+            observed_at=NOW,
+            surface="most_read",
+            position=position,
+            title=title,
+            url=f"https://www.bbc.co.uk/news/articles/{position}",
+        )
+
+    existing = observations_table([observation(1, "Old"), observation(2, "Kept")])
+    incoming = observations_table([observation(1, "New")])
+    merged = merge_unique(existing, incoming, ("scrape_id", "surface", "position"))
+
+    assert merged.column("title").to_pylist() == ["New", "Kept"]
+    assert merged.schema == incoming.schema
+
+
 def test_article_html_is_excluded_from_public_table() -> None:
     row = ArticleSnapshot.create(
         requested_url="https://www.bbc.co.uk/news/articles/example",